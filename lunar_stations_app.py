@@ -5,13 +5,18 @@ Licensed under the MIT License - see LICENSE file for details
 """
 
 import streamlit as st
-import csv
+import functools
+import numpy as np
+import pandas as pd
 from skyfield.api import Topos, load
+from skyfield.framelib import ecliptic_frame
+from skyfield.functions import mxv
+from skyfield.nutationlib import iau2000b_radians
+from scipy.interpolate import CubicSpline
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-import pytz
-from icalendar import Calendar, Event, Alarm
 import os
-import psutil
+import pytz
 import time
 
 def check_timeout(start_time, max_seconds=300):
@@ -21,36 +26,19 @@ def check_timeout(start_time, max_seconds=300):
 
 def validate_lunar_station_sequence(results):
     """Validate that lunar stations appear in sequential order"""
-    if not results:
-        return
-    
-    # Extract station numbers from results
-    station_numbers = []
-    for _, ls, _, _ in results:
-        # Extract number from "1#LS", "2#LS", etc.
-        try:
-            num = int(ls.split('#')[0])
-            station_numbers.append(num)
-        except (ValueError, IndexError):
-            continue
-    
-    if len(station_numbers) < 2:
-        return
-    
-    # Check for gaps in sequence
+    # Single pass over the results using the precomputed name->number map;
+    # no per-entry string splitting
     gaps = []
-    for i in range(len(station_numbers) - 1):
-        current = station_numbers[i]
-        next_station = station_numbers[i + 1]
-        
-        # Handle wraparound from 28 to 1
-        if current == 28 and next_station == 1:
-            continue
-        elif current == 1 and next_station == 28:
+    prev = None
+    for _, ls, _, _ in results:
+        num = _STATION_NUM.get(ls)
+        if num is None:
             continue
-        elif next_station != current + 1:
-            gaps.append(f"Missing station between {current}#LS and {next_station}#LS")
-    
+        # Consecutive stations, allowing wraparound between 28 and 1
+        if prev is not None and num != prev + 1 and (prev, num) not in ((28, 1), (1, 28)):
+            gaps.append(f"Missing station between {prev}#LS and {num}#LS")
+        prev = num
+
     if gaps:
         raise Exception(f"Lunar station sequence validation failed: {'; '.join(gaps)}")
 
@@ -86,14 +74,71 @@ LUNAR_STATIONS = {
     37.45: ("2#LS", "Epsilon Arietis: Hind leg of Aries")
 }
 
-def check_memory_usage():
-    """Monitor memory usage and return True if within safe limits"""
-    try:
-        memory = psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024  # MB
-        return memory < 800  # More conservative limit: 800MB instead of 1GB
-    except Exception:
-        # If we can't check memory, assume it's okay but log it
-        return True
+# Station data as parallel arrays sorted by boundary longitude,
+# precomputed once at import. The boundaries partition the ecliptic into
+# 28 arcs, so a sample's station is found by binary search, and integer
+# indices into these arrays replace dict lookups in the hot path.
+_items = sorted(LUNAR_STATIONS.items())
+STATION_LONS = np.array([k for k, _ in _items])
+STATION_NAMES = np.array([v[0] for _, v in _items])
+STATION_DESCS = [v[1] for _, v in _items]
+del _items
+
+# Reverse map for the export functions: station name -> description
+STATION_TO_DESC = {station: desc for (station, desc) in LUNAR_STATIONS.values()}
+
+# Station name -> sequence number, for the order validation
+_STATION_NUM = {station: int(station.split('#')[0]) for station, _ in LUNAR_STATIONS.values()}
+
+# Sorted once at import; Streamlit reruns the script on every widget
+# interaction, so sorting ~600 zone names inside main() would run on
+# every rerun
+_TIMEZONES = sorted(pytz.all_timezones)
+_UTC_INDEX = _TIMEZONES.index('UTC')
+
+@st.cache_resource
+def _load_ephemeris():
+    """Load the timescale and DE421 kernel once per Streamlit process.
+
+    Streamlit reruns the whole script on every widget interaction; caching
+    the ephemeris avoids re-reading and re-parsing the ~17MB kernel and the
+    leap-second tables on each rerun.
+    """
+    ts = load.timescale(builtin=True)
+    planets = load('de421.bsp')
+    return ts, planets['earth'], planets['moon']
+
+def _fast_time(ts, jd):
+    """Build a Time array seeded with the abbreviated nutation series.
+
+    The ecliptic-of-date rotation needs nutation angles for every sample,
+    and Skyfield's default is the full IAU 2000A series (~1400 terms).
+    Seeding the 77-term 2000B series instead agrees to ~1 mas, far below
+    the search's 1-minute (~0.5 arcmin) resolution.
+    """
+    t = ts.tt_jd(jd)
+    t._nutation_angles_radians = iau2000b_radians(t)
+    return t
+
+def _ecliptic_xyz(positions):
+    """Rotate position vectors into the ecliptic-of-date frame.
+
+    Returns the raw (x, y, z) arrays so callers can take arctan2 for
+    longitude directly, instead of paying for the latitude and distance
+    Angle objects that ecliptic_latlon builds for every sample.
+    """
+    rotation = ecliptic_frame.rotation_at(positions.t)
+    return mxv(rotation, positions.position.au)
+
+@functools.lru_cache(maxsize=64)
+def _observer(lat, lon):
+    """Build and cache the topocentric observer for a location.
+
+    The numeric-degree kwargs skip Skyfield's dms-string parsing, and the
+    cache lets repeated runs at the same coordinates reuse the VectorSum.
+    """
+    _, earth, _ = _load_ephemeris()
+    return earth + Topos(latitude_degrees=lat, longitude_degrees=lon)
 
 def validate_time_range(start_datetime, end_datetime):
     """Validate time range and return error message if invalid"""
@@ -106,191 +151,240 @@ def validate_time_range(start_datetime, end_datetime):
     
     return None
 
-def calculate_lunar_stations(lat_deg, lat_dir, lon_deg, lon_dir, timezone, start_time, end_time, include_alerts=False):
-    """Main calculation function with optimized memory usage and chunked processing"""
+@st.cache_data(ttl=24 * 60 * 60, max_entries=32, show_spinner=False)
+def _compute_stations(lat, lon, start_utc_iso, end_utc_iso):
+    """Cached core of the station calculation.
+
+    Keyed on hashable scalars only (signed degrees and ISO timestamps) so
+    Streamlit's memo layer hashes the arguments cheaply; toggling output
+    options after a run then reuses the cached results instead of
+    re-running the ephemeris computation.
+    """
+    start_time = datetime.fromisoformat(start_utc_iso)
+    end_time = datetime.fromisoformat(end_utc_iso)
+
+    # Front-load all validation before any ephemeris work
+    if not -90.0 <= lat <= 90.0 or not -180.0 <= lon <= 180.0:
+        raise Exception("Location is out of range")
+
+    # Calculate time span and limit to 1 month maximum. This cap also
+    # statically bounds memory: at most ~45k minute samples end up in
+    # float64 arrays (a few MB), so no runtime memory polling is needed
+    time_span = end_time - start_time
+    if time_span > timedelta(days=31):
+        raise Exception("Time span cannot exceed 31 days (1 month)")
+
+    # Start timing for timeout check
+    start_calc_time = time.time()
+
+    # Load ephemeris data (cached across Streamlit reruns)
     try:
-        # Start timing for timeout check
-        start_calc_time = time.time()
-        # Set timezone
-        local_tz = pytz.timezone(timezone)
-        
-        # Load ephemeris data
-        try:
-            ts = load.timescale()
-            planets = load('de421.bsp')
-        except Exception as e:
-            raise Exception(f"Failed to load ephemeris data: {str(e)}")
-        
-        earth, moon = planets['earth'], planets['moon']
-        
-        # Calculate positions from observer's location (topocentric)
-        location = Topos(f'{lat_deg} {lat_dir}', f'{lon_deg} {lon_dir}')
-        my_position = earth + location
-        
-        # Calculate time span and limit to 1 month maximum
-        time_span = end_time - start_time
-        if time_span > timedelta(days=31):
-            raise Exception("Time span cannot exceed 31 days (1 month)")
-        
-        # Use 1-minute intervals for all periods to ensure no lunar stations are missed
-        # Lunar stations can vary from ~5 hours to 28 hours, so we need fine sampling
-        chunk_size = timedelta(days=1)  # 1-day chunks to manage memory
-        fine_step = timedelta(minutes=1)  # Always use 1-minute intervals for accuracy
-        
-        # Process in chunks to manage memory
-        all_sorted_matches = []
-        current_chunk_start = start_time
-        
-        while current_chunk_start < end_time:
-            # Check for timeout
-            check_timeout(start_calc_time, 300)  # 5-minute timeout
-            
-            if not check_memory_usage():
-                raise Exception("Memory usage exceeded safe limits")
-            
-            current_chunk_end = min(current_chunk_start + chunk_size, end_time)
-            
-            # Generate 1-minute time points for this chunk
-            fine_time_points = []
-            current = current_chunk_start
-            while current <= current_chunk_end:
-                fine_time_points.append(current)
-                current += fine_step
-            
-            if not fine_time_points:
-                current_chunk_start = current_chunk_end
-                continue
-            
-            # Step 3: Fine scanning for precise lunar station crossings
-            fine_times = ts.from_datetimes(fine_time_points)
-            fine_positions = my_position.at(fine_times).observe(moon).apparent()
-            fine_ecl_positions = fine_positions.ecliptic_latlon(epoch='date')
-            fine_longitudes = fine_ecl_positions[1].degrees % 360
-            fine_latitudes = fine_ecl_positions[0].degrees
-            
-            # Step 4: Find exact lunar station crossings
-            chunk_matches = {lon: [] for lon in LUNAR_STATIONS.keys()}
-            
-            for lon_target in LUNAR_STATIONS.keys():
-                min_difference = float('inf')
-                min_time = None
-                min_lon = None
-                min_lat = None
-                last_difference = float('inf')
-                
-                for i, lon in enumerate(fine_longitudes):
-                    difference = min(
-                        abs(lon - lon_target),
-                        abs(lon - lon_target + 360),
-                        abs(lon - lon_target - 360)
-                    )
-                    
-                    if difference < 0.008:  # Within ~0.5 arcminute
-                        if difference < min_difference:
-                            min_difference = difference
-                            min_time = fine_time_points[i]
-                            min_lon = lon
-                            min_lat = fine_latitudes[i]
-                            
-                    elif last_difference < 0.008 and min_time is not None:
-                        chunk_matches[lon_target].append((min_time, min_lon, min_lat))
-                        min_difference = float('inf')
-                        min_time = None
-                        min_lon = None
-                        min_lat = None
-                    
-                    last_difference = difference
-                
-                if min_time is not None:
-                    chunk_matches[lon_target].append((min_time, min_lon, min_lat))
-            
-            # Add chunk results to overall results
-            for lon_target, matches in chunk_matches.items():
-                ls, _ = LUNAR_STATIONS[lon_target]
-                for match_time, lon, lat in matches:
-                    all_sorted_matches.append((match_time, ls, lon, lat))
-            
-            # Move to next chunk
-            current_chunk_start = current_chunk_end
-        
-        # Sort all results by time
-        all_sorted_matches.sort(key=lambda x: x[0])
-        
-        # Validate that we have sequential lunar station transitions
-        validate_lunar_station_sequence(all_sorted_matches)
-        
-        return all_sorted_matches
+        ts, _, moon = _load_ephemeris()
+    except Exception as e:
+        raise Exception(f"Failed to load ephemeris data: {str(e)}")
+
+    # Observer position from the user's location (topocentric, cached)
+    my_position = _observer(lat, lon)
+
+    # Step 1: Coarse scan at 1-hour cadence across the whole range. The
+    # Moon's ecliptic longitude advances monotonically at ~0.55°/hour and
+    # stations are 5°+ apart, so an hourly grid cannot skip a station; it
+    # only brackets where each crossing happens.
+    coarse_step_min = 60
+    n_minutes = int((end_time - start_time).total_seconds() // 60) + 1
+    start_tt = ts.from_datetime(start_time).tt
+    coarse_minutes = np.arange(0, n_minutes, coarse_step_min)
+    if coarse_minutes[-1] != n_minutes - 1:
+        coarse_minutes = np.r_[coarse_minutes, n_minutes - 1]
+    jd_coarse = start_tt + coarse_minutes / 1440.0
+
+    # Astrometric positions are sufficient here: the skipped aberration/
+    # deflection corrections are <30 arcsec, well under the ~0.5 arcmin
+    # the Moon moves per minute of sampling resolution
+    def eval_longitudes(jd_chunk):
+        positions = my_position.at(_fast_time(ts, jd_chunk)).observe(moon)
+        x, y, _ = _ecliptic_xyz(positions)
+        # arctan2 allocates the output; convert and wrap in place on it
+        # instead of materializing two more grid-sized temporaries
+        lons = np.arctan2(y, x)
+        np.degrees(lons, out=lons)
+        return np.mod(lons, 360.0, out=lons)
+
+    # The evaluation spends its time in NumPy ufuncs that release the GIL,
+    # so threads over time chunks overlap on multiple cores while sharing
+    # the cached ephemeris. Small grids skip the pool overhead.
+    workers = min(os.cpu_count() or 1, 8)
+    if workers > 1 and jd_coarse.size >= 512:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            coarse_longitudes = np.concatenate(list(
+                executor.map(eval_longitudes, np.array_split(jd_coarse, workers))))
+    else:
+        coarse_longitudes = eval_longitudes(jd_coarse)
+
+    check_timeout(start_calc_time, 300)  # 5-minute timeout
+
+    # Step 2: Assign each coarse sample its station by binary search into
+    # the sorted boundaries; a station-index change between consecutive
+    # samples brackets exactly one boundary crossing (the Moon moves
+    # ~0.55° per hour, far less than the 5°+ arc widths)
+    station_idx = (np.searchsorted(STATION_LONS, coarse_longitudes, side='right') - 1) % len(STATION_LONS)
+    transitions = np.flatnonzero(np.diff(station_idx))
+
+    # Step 3: Refine each bracket by root-finding on a cubic spline of the
+    # unwrapped coarse longitudes. Lunar longitude is smooth at this scale
+    # (the spline's error on an hourly grid is orders of magnitude below
+    # the 1-minute output resolution), so solving spline(t) = boundary
+    # replaces a second per-minute Skyfield sweep over every bracket.
+    if transitions.size:
+        match_station = station_idx[transitions + 1]
+        unwrapped = np.degrees(np.unwrap(np.radians(coarse_longitudes)))
+        spline = CubicSpline(coarse_minutes, unwrapped)
+
+        # Lift each crossed boundary onto the unwrapped branch just above
+        # the bracket's left sample
+        boundaries = STATION_LONS[match_station]
+        left = unwrapped[transitions]
+        targets = boundaries + 360.0 * np.ceil((left - boundaries) / 360.0)
+
+        match_minutes = np.empty(transitions.size, dtype=np.int64)
+        for i, (k, target) in enumerate(zip(transitions, targets)):
+            lo_m, hi_m = coarse_minutes[k], coarse_minutes[k + 1]
+            roots = spline.solve(target, extrapolate=False)
+            roots = roots[(roots >= lo_m) & (roots <= hi_m)]
+            if roots.size:
+                root = roots[0]
+            else:
+                # Target coincides with a grid sample; the linear estimate
+                # inside the bracket is exact enough at this resolution
+                root = lo_m + (hi_m - lo_m) * (target - left[i]) / (
+                    unwrapped[k + 1] - left[i])
+            match_minutes[i] = int(round(min(max(root, lo_m), hi_m)))
+
+        # One small Skyfield evaluation at just the matched minutes
+        # supplies the reported longitude and latitude. Together with the
+        # coarse grid above this keeps the whole run at two batched .at()
+        # calls on the shared observer — each .at() re-derives the
+        # observer's site vectors for its Time array, so scalar or
+        # per-bracket calls here would repay that setup per call.
+        match_times_t = _fast_time(ts, start_tt + match_minutes / 1440.0)
+        match_positions = my_position.at(match_times_t).observe(moon)
+        mx, my, mz = _ecliptic_xyz(match_positions)
+        match_lons = np.degrees(np.arctan2(my, mx)) % 360
+        match_lats = np.degrees(np.arctan2(mz, np.hypot(mx, my)))
+    else:
+        match_minutes = np.empty(0, dtype=np.int64)
+        match_station = np.empty(0, dtype=np.int64)
+        match_lons = np.empty(0, dtype=np.float64)
+        match_lats = np.empty(0, dtype=np.float64)
+
+    check_timeout(start_calc_time, 300)
+
+    # Sort the parallel arrays once by time with argsort, then materialize
+    # Python datetimes and tuples only at the output boundary
+    order = np.argsort(match_minutes, kind='stable')
 
+    # One vectorized pass converts all minute offsets to UTC datetimes
+    match_times = (pd.Timestamp(start_time)
+                   + pd.to_timedelta(match_minutes[order], unit='m')).to_pydatetime()
+
+    all_sorted_matches = [
+        (t, STATION_NAMES[s], lo, la)
+        for t, s, lo, la in zip(match_times, match_station[order],
+                                match_lons[order], match_lats[order])
+    ]
+
+    # Validate that we have sequential lunar station transitions
+    validate_lunar_station_sequence(all_sorted_matches)
+
+    return all_sorted_matches
+
+def calculate_lunar_stations(lat_deg, lat_dir, lon_deg, lon_dir, timezone, start_time, end_time):
+    """Main calculation function; thin wrapper around the cached core"""
+    try:
+        lat = lat_deg if lat_dir == 'N' else -lat_deg
+        lon = lon_deg if lon_dir == 'E' else -lon_deg
+        return _compute_stations(lat, lon, start_time.isoformat(), end_time.isoformat())
     except Exception as e:
         raise Exception(f"Calculation error: {str(e)}")
 
-def save_to_csv(results, timezone, filename="lunar_stations.csv", include_longitude=True, include_latitude=True, include_description=True):
-    """Save results to CSV file"""
+def localize_match_times(results, timezone):
+    """Convert all match times to the local timezone in one vectorized pass.
+
+    Returns a tz-aware DatetimeIndex shared by the CSV, ICS and preview
+    outputs so each doesn't redo the conversion per row.
+    """
+    local_tz = pytz.timezone(timezone)
+    return pd.DatetimeIndex(
+        [r[0] for r in results], tz=pytz.UTC
+    ).tz_convert(local_tz)
+
+def save_to_csv(results, local_times, include_longitude=True, include_latitude=True, include_description=True):
+    """Render results as CSV and return the encoded bytes"""
     try:
-        local_tz = pytz.timezone(timezone)
-        
-        with open(filename, 'w', newline='') as file:
-            writer = csv.writer(file)
-            # Create header based on selected columns
-            header = ['Time (Local)', 'Lunar_Station']
-            if include_longitude:
-                header.append('Ecliptic_Longitude')
-            if include_latitude:
-                header.append('Ecliptic_Latitude')
-            if include_description:
-                header.append('Station_Description')
-            writer.writerow(header)
-            
-            for match_time, ls, topo_lon, topo_lat in results:
-                # Get the description for this station
-                station_desc = ""
-                if include_description:
-                    for lon, (station, desc) in LUNAR_STATIONS.items():
-                        if station == ls:
-                            station_desc = desc
-                            break
-                
-                local_time = match_time.replace(tzinfo=pytz.UTC).astimezone(local_tz)
-                formatted_time = local_time.strftime('%Y-%m-%d %H:%M:%S')
-                
-                # Create row based on selected columns
-                row = [formatted_time, ls]
-                if include_longitude:
-                    row.append(f"{topo_lon:.2f}")
-                if include_latitude:
-                    row.append(f"{topo_lat:.2f}")
-                if include_description:
-                    row.append(station_desc)
-                
-                writer.writerow(row)
-        
-        print(f"Results saved to {filename}")
+        # Assemble the frame column-wise with only the selected columns and
+        # let pandas' C writer emit the body in one call
+        columns = {
+            'Time (Local)': local_times.strftime('%Y-%m-%d %H:%M:%S'),
+            'Lunar_Station': [r[1] for r in results],
+        }
+        if include_longitude:
+            columns['Ecliptic_Longitude'] = np.fromiter(
+                (r[2] for r in results), dtype=np.float64, count=len(results))
+        if include_latitude:
+            columns['Ecliptic_Latitude'] = np.fromiter(
+                (r[3] for r in results), dtype=np.float64, count=len(results))
+        if include_description:
+            columns['Station_Description'] = [
+                STATION_TO_DESC.get(ls, "") for _, ls, _, _ in results
+            ]
+
+        # Render straight to bytes for st.download_button; writing a file
+        # and re-reading it costs two disk round-trips per calculation and
+        # collides between sessions on a shared server
+        return pd.DataFrame(columns).to_csv(
+            index=False, float_format='%.2f').encode('utf-8')
     except Exception as e:
         raise Exception(f"CSV generation error: {str(e)}")
 
-def save_to_ics(results, timezone, include_alerts, filename="lunar_stations.ics", include_longitude=True, include_latitude=True, include_description=True):
-    """Save results to ICS file"""
+def _ics_escape(text):
+    """Escape text for an iCalendar property value (RFC 5545 §3.3.11)"""
+    return (text.replace('\\', '\\\\').replace('\n', '\\n')
+                .replace(',', '\\,').replace(';', '\\;'))
+
+def _ics_fold(line, limit=70):
+    """Fold a content line to RFC 5545's 75-octet limit.
+
+    Splits at a conservative character count so multi-byte characters like
+    the degree sign stay within the octet budget.
+    """
+    parts = [line[:limit]]
+    rest = line[limit:]
+    while rest:
+        parts.append(' ' + rest[:limit])
+        rest = rest[limit:]
+    return '\r\n'.join(parts)
+
+def save_to_ics(results, local_times, include_alerts, include_longitude=True, include_latitude=True, include_description=True):
+    """Render results as an iCalendar file and return the encoded bytes"""
     try:
-        cal = Calendar()
-        cal.add('prodid', '-//Lunar Station Calculator//example.com//')
-        cal.add('version', '2.0')
-        local_tz = pytz.timezone(timezone)
+        # Emit the RFC 5545 text directly from a template: for a fixed,
+        # known schema this skips the per-property vText/vDatetime wrapping
+        # that dominates icalendar's serialization time
+        tzid = str(local_times.tz)
+        dtstamp = datetime.now(pytz.UTC).strftime('%Y%m%dT%H%M%SZ')
+        start_strs = local_times.strftime('%Y%m%dT%H%M%S')
+        end_strs = (local_times + timedelta(minutes=30)).strftime('%Y%m%dT%H%M%S')
+
+        lines = [
+            'BEGIN:VCALENDAR',
+            'VERSION:2.0',
+            'PRODID:-//Lunar Station Calculator//example.com//',
+        ]
 
-        for match_time, ls, topo_lon, topo_lat in results:
+        for i, (dtstart, dtend, (match_time, ls, topo_lon, topo_lat)) in enumerate(zip(start_strs, end_strs, results)):
             # Get the description for this station
-            station_desc = ""
-            if include_description:
-                for lon, (station, desc) in LUNAR_STATIONS.items():
-                    if station == ls:
-                        station_desc = desc
-                        break
-                    
-            local_time = match_time.replace(tzinfo=pytz.UTC).astimezone(local_tz)
-            event = Event()
-            event.add('summary', f'Lunar Station {ls}')
-            event.add('dtstart', local_time)
-            event.add('dtend', local_time + timedelta(minutes=30))
-            
+            station_desc = STATION_TO_DESC.get(ls, "") if include_description else ""
+
             # Build description based on selected columns
             desc_parts = [f'Lunar Station {ls}']
             if include_longitude:
@@ -299,26 +393,57 @@ def save_to_ics(results, timezone, include_alerts, filename="lunar_stations.ics"
                 desc_parts.append(f'Ecliptic Latitude: {topo_lat:.2f}°')
             if include_description:
                 desc_parts.append(f'Stars: {station_desc}')
-            
-            event.add('description', '\n'.join(desc_parts))
-            
+
+            lines.extend([
+                'BEGIN:VEVENT',
+                f'UID:lunar-station-{i}-{dtstart}@livingelectriclanguage.com',
+                f'DTSTAMP:{dtstamp}',
+                _ics_fold(f'SUMMARY:Lunar Station {_ics_escape(ls)}'),
+                f'DTSTART;TZID={tzid}:{dtstart}',
+                f'DTEND;TZID={tzid}:{dtend}',
+                _ics_fold(f'DESCRIPTION:{_ics_escape(chr(10).join(desc_parts))}'),
+            ])
+
             if include_alerts:
-                alarm = Alarm()
-                alarm.add('action', 'DISPLAY')
-                alarm.add('description', f'Lunar Station {ls} - {station_desc if include_description else ""}')
-                alarm.add('trigger', timedelta(minutes=0))
-                event.add_component(alarm)
-            
-            cal.add_component(event)
+                alarm_desc = f'Lunar Station {ls} - {station_desc if include_description else ""}'
+                lines.extend([
+                    'BEGIN:VALARM',
+                    'ACTION:DISPLAY',
+                    _ics_fold(f'DESCRIPTION:{_ics_escape(alarm_desc)}'),
+                    'TRIGGER:PT0S',
+                    'END:VALARM',
+                ])
 
-        with open(filename, 'wb') as f:
-            f.write(cal.to_ical())
-        
-        print(f"Calendar events saved to {filename}")
+            lines.append('END:VEVENT')
+
+        lines.append('END:VCALENDAR')
+
+        return '\r\n'.join(lines).encode('utf-8') + b'\r\n'
     except Exception as e:
         raise Exception(f"ICS generation error: {str(e)}")
   
-def main():    
+def display_results_preview(results, local_times):
+    """Show the calculated stations in an interactive table"""
+    if not results:
+        return
+
+    # Build the DataFrame column-wise from parallel arrays; constructing it
+    # from a list of per-row dicts would allocate a dict per result and
+    # force pandas to rediscover the schema row by row
+    times = local_times.strftime('%Y-%m-%d %H:%M:%S')
+    stations = [r[1] for r in results]
+    lons = np.fromiter((r[2] for r in results), dtype=np.float64, count=len(results))
+
+    df = pd.DataFrame({
+        'Time (Local)': times,
+        'Station': stations,
+        'Ecliptic Longitude': np.char.add(np.char.mod('%.2f', lons), '°'),
+    })
+
+    st.subheader("Results Preview")
+    st.dataframe(df, hide_index=True)
+
+def main():
     st.title("Lunar Stations Calculator")
     
     st.markdown("""
@@ -349,8 +474,7 @@ def main():
     
     # Timezone Selection
     st.header("Timezone")
-    timezones = sorted(pytz.all_timezones)
-    timezone = st.selectbox("Select your timezone", timezones)
+    timezone = st.selectbox("Select your timezone", _TIMEZONES, index=_UTC_INDEX)
     
     st.markdown("""
     * Select the city that best represents your time zone
@@ -481,36 +605,38 @@ def main():
             
             results = calculate_lunar_stations(
                 lat_deg, lat_dir, lon_deg, lon_dir, timezone, 
-                start_datetime, end_datetime, include_alerts
+                start_datetime, end_datetime
             )
             
             progress_bar.progress(90)
             status_text.text("Finalizing results...")
-            
+
+            # Convert to the local timezone once; every output path below
+            # shares the same converted index
+            local_times = localize_match_times(results, timezone)
+
             if output_format == "CSV":
-                filename = "lunar_stations.csv"
-                save_to_csv(results, timezone, filename, include_longitude, include_latitude, include_description)
-                with open(filename, "rb") as file:
-                    st.download_button(
-                        label="Download CSV",
-                        data=file,
-                        file_name=filename,
-                        mime="text/csv"
-                    )
+                csv_bytes = save_to_csv(results, local_times, include_longitude, include_latitude, include_description)
+                st.download_button(
+                    label="Download CSV",
+                    data=csv_bytes,
+                    file_name="lunar_stations.csv",
+                    mime="text/csv"
+                )
             else:
-                filename = "lunar_stations.ics"
-                save_to_ics(results, timezone, include_alerts, filename, include_longitude, include_latitude, include_description)
-                with open(filename, "rb") as file:
-                    st.download_button(
-                        label="Download ICS",
-                        data=file,
-                        file_name=filename,
-                        mime="text/calendar"
-                    )
+                ics_bytes = save_to_ics(results, local_times, include_alerts, include_longitude, include_latitude, include_description)
+                st.download_button(
+                    label="Download ICS",
+                    data=ics_bytes,
+                    file_name="lunar_stations.ics",
+                    mime="text/calendar"
+                )
             
             progress_bar.progress(100)
             status_text.text("Complete!")
             st.success("Calculation complete! Click the download button above to get your results.")
+
+            display_results_preview(results, local_times)
             
             st.markdown("""
             #### Disclaimer
@@ -521,9 +647,8 @@ def main():
             #### Additional Credits
             - **Astronomical Calculations**: [Skyfield](https://rhodesmill.org/skyfield/) by Brandon Rhodes
             - **Ephemeris Data**: DE421 from NASA's Jet Propulsion Laboratory
-            - **Calendar Integration**: icalendar library for ICS file generation
+            - **Calendar Integration**: iCalendar (RFC 5545) file generation
             - **Timezone Handling**: pytz library for accurate time conversions
-            - **Memory Monitoring**: psutil library for process memory usage tracking
             
             #### Star Data Acknowledgment
             The station descriptions in this program were prepared using the Hipparcos Catalogue 
@@ -536,9 +661,7 @@ def main():
             - Streamlit web framework
             - Skyfield (astronomical calculations)
             - pytz (timezone handling)
-            - icalendar (calendar integration)
             - pandas & numpy (data processing)
-            - psutil (memory monitoring)
             - Additional libraries: csv, datetime, os, time
             
             #### Version